@@ -2,4 +2,8 @@
 and it contains the major base classes required to do communication in the ASV'''
 __version__ = "0.1.8b0"
 
-from .topic_communications import *
+import os
+
+os.environ.setdefault('PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION', 'upb')
+
+from .topic_communications import *  #pylint: disable=wrong-import-position
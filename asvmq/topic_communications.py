@@ -11,22 +11,148 @@ You can use the Publisher object to send data and Subscriber object to receive i
 import uuid
 import sys
 import os
+import struct
+import atexit
+import threading
 import traceback
 import pika
-import asvprotobuf.std_pb2
-from google.protobuf.json_format import MessageToJson
+
+os.environ.setdefault('PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION', 'upb')
+
+import asvprotobuf.std_pb2  #pylint: disable=wrong-import-position
+from google.protobuf.json_format import MessageToJson, MessageToDict  #pylint: disable=wrong-import-position
+from google.protobuf.message import DecodeError, EncodeError  #pylint: disable=wrong-import-position
+from google.protobuf.internal import api_implementation  #pylint: disable=wrong-import-position
+
+assert api_implementation.Type() in ('cpp', 'upb'), \
+"protobuf is using its pure-Python backend; install protobuf with the C extension"
+
+try:
+    import orjson  #pylint: disable=wrong-import-position
+except ImportError:
+    orjson = None
 
 DEFAULT_EXCHANGE_NAME = "asvmq"
 LOG_EXCHANGE_NAME = "logs"
 GRAPH_EXCHANGE_NAME = "graph"
 
 channel = None
+connection = None
+
+_process_node_suffix = str(uuid.uuid4())
+
+_connection_pool = {}
+_log_channels = {}
+
+_JSON_DELETE = b'\n'
+
+def _encode_varint(value: 'int') -> 'Protobuf varint bytes':
+    """Encodes an unsigned integer as a protobuf base-128 varint"""
+    buf = bytearray()
+    while True:
+        byte = value & 0x7f
+        value >>= 7
+        if value:
+            buf.append(byte | 0x80)
+        else:
+            buf.append(byte)
+            return bytes(buf)
+
+def _encode_str_field(field_number: 'int', value: 'str or bytes') -> 'Length-delimited field bytes':
+    """Encodes a string/bytes field as a length-delimited wire-format field"""
+    data = value.encode() if isinstance(value, str) else value
+    return _encode_varint(field_number << 3 | 2) + _encode_varint(len(data)) + data
+
+_LOG_FIELDS = asvprotobuf.std_pb2.Log.DESCRIPTOR.fields_by_name
+_GRAPH_FIELDS = asvprotobuf.std_pb2.Graph.DESCRIPTOR.fields_by_name
+
+_LOG_LEVEL_TAG = _encode_varint(_LOG_FIELDS['level'].number << 3)
+_LOG_NAME_NUM = _LOG_FIELDS['name'].number
+_LOG_MESSAGE_NUM = _LOG_FIELDS['message'].number
+_GRAPH_SENDER_NUM = _GRAPH_FIELDS['sender'].number
+_GRAPH_MSG_TYPE_NUM = _GRAPH_FIELDS['msg_type'].number
+_GRAPH_RECEIVER_NUM = _GRAPH_FIELDS['receiver'].number
+if _GRAPH_FIELDS['freq'].type == _GRAPH_FIELDS['freq'].TYPE_DOUBLE:
+    _GRAPH_FREQ_TAG = _encode_varint(_GRAPH_FIELDS['freq'].number << 3 | 1)
+    _GRAPH_FREQ_PACK = '<d'
+else:
+    _GRAPH_FREQ_TAG = _encode_varint(_GRAPH_FIELDS['freq'].number << 3 | 5)
+    _GRAPH_FREQ_PACK = '<f'
+
+def _serialize_log(level: 'int', name: 'str', message: 'str or bytes') -> 'Log wire format':
+    """Emits the asvprotobuf.std_pb2.Log wire format directly, skipping
+    message construction and reflective field assignment for the fixed
+    three-field envelope. Field numbers come from the generated
+    descriptor, so a schema change cannot silently skew the output"""
+    out = b''
+    if level:
+        out += _LOG_LEVEL_TAG + _encode_varint(level)
+    if name:
+        out += _encode_str_field(_LOG_NAME_NUM, name)
+    if message:
+        out += _encode_str_field(_LOG_MESSAGE_NUM, message)
+    return out
+
+def _serialize_graph(sender: 'str', msg_type: 'str', receiver: 'str', freq: 'float') -> 'Graph wire format': # pylint: disable=line-too-long
+    """Emits the asvprotobuf.std_pb2.Graph wire format directly, same
+    rationale as _serialize_log. Field numbers and the freq wire type
+    come from the generated descriptor"""
+    out = b''
+    if sender:
+        out += _encode_str_field(_GRAPH_SENDER_NUM, sender)
+    if msg_type:
+        out += _encode_str_field(_GRAPH_MSG_TYPE_NUM, msg_type)
+    if receiver:
+        out += _encode_str_field(_GRAPH_RECEIVER_NUM, receiver)
+    if freq:
+        out += _GRAPH_FREQ_TAG + struct.pack(_GRAPH_FREQ_PACK, freq)
+    return out
+
+def _json_bytes(message: 'Protobuf Message') -> 'Serializes message to compact JSON bytes':
+    """Serializes a protobuf message to compact JSON, preferring orjson's
+    C encoder over the reflective MessageToJson walk when it is installed.
+    The fallback strips newlines in a single translate pass, as not every
+    protobuf release honours indent=None"""
+    if orjson is not None:
+        return orjson.dumps(MessageToDict(message, preserving_proto_field_name=True))
+    return MessageToJson(message, preserving_proto_field_name=True,\
+     indent=None).encode().translate(None, delete=_JSON_DELETE)
+
+_pool_lock = threading.Lock()
+
+def _get_connection(parameters: 'pika.ConnectionParameters') -> 'Returns pooled BlockingConnection':
+    """Returns the process-wide connection for the given broker, opening
+    it on first use. Every Channel shares the connection for its broker
+    instead of paying the TCP/AMQP handshake per object"""
+    key = (parameters.host, parameters.port)
+    with _pool_lock:
+        conn = _connection_pool.get(key)
+        if conn is None or conn.is_closed:
+            conn = pika.BlockingConnection(parameters)
+            _connection_pool[key] = conn
+        return conn
+
+def _close_connections() -> 'Closes every pooled connection':
+    """Closes the pooled connections so sockets are returned to the OS
+    promptly instead of waiting for the broker to notice the process died.
+    Registered with atexit; safe to call more than once"""
+    with _pool_lock:
+        for conn in _connection_pool.values():
+            if conn.is_open:
+                try:
+                    conn.close()
+                except Exception:  #pylint: disable=broad-except
+                    pass
+        _connection_pool.clear()
+
+atexit.register(_close_connections)
 
 #TODO: Create a subscriber for reading a particular level of logging and displaying on screen
 
 class Channel:
     """Internal class for Using Common Functionalities of RabbitMQ and Pika"""
     init_params = '[<exchange_name>], [<exchange_type>], [<node_name>], [<hostname>], [<port>]'
+    _declared_exchanges = set()
     def __init__(self, *args: init_params, **kwargs: init_params) -> 'Constructs Channel Object':
         """Initialises a producer node for RabbitMQ.
         Base Class for the rest of the Communication Classes
@@ -36,11 +162,11 @@ class Channel:
         exchange_type = args[1] if len(args) > 1 \
         else kwargs.get('exchange_type', 'direct')
         self._node_name = args[2] if len(args) > 2 \
-        else kwargs.get('node_name', 'node')+str(uuid.uuid4())
+        else kwargs.get('node_name', 'node')+_process_node_suffix
         hostname = args[3] if len(args) > 3 else kwargs.get('hostname', 'localhost')
         port = args[4] if len(args) > 4 else kwargs.get('port', 5672)
         self._parameters = pika.ConnectionParameters(hostname, port)
-        self._exchange_name = exchange_name
+        self._exchange_name = sys.intern(exchange_name)
         self._exchange_type = exchange_type
         self.create()
 
@@ -81,14 +207,24 @@ class Channel:
 
     def create(self) -> 'Initiates the channel during init':
         """Initiates the Blocking Connection and the Channel for the process"""
-        global channel
+        global channel, connection
         if channel is None:
-            connection = pika.BlockingConnection(self.params)
+            connection = _get_connection(self.params)
             channel = connection.channel()
-        channel.exchange_declare(exchange=self.exchange_name,\
-         exchange_type=self.exchange_type)
-
-class Publisher(Channel):
+            Channel._declared_exchanges.clear()
+            _log_channels.clear()
+        self._declare_exchange(self.exchange_name, self.exchange_type)
+
+    def _declare_exchange(self, name: 'Exchange name', extype: 'Exchange type') -> 'Declares exchange once': # pylint: disable=line-too-long
+        """Declares an exchange on the shared channel unless it has
+        already been declared; each declare is a synchronous AMQP
+        round-trip, so repeats are pure latency"""
+        key = (id(channel), name, extype)
+        if key not in Channel._declared_exchanges:
+            channel.exchange_declare(exchange=name, exchange_type=extype)
+            Channel._declared_exchanges.add(key)
+
+class Publisher(Channel):  #pylint: disable=too-many-instance-attributes
     """Class to use for publisher in Topic topology. Use exchange name as 'asvmq'
     To publish, first initialize the class in the following manner:
     obj = Publisher(<topic_name>,[<object_type>], [<hostname>], [<port>])
@@ -101,14 +237,24 @@ class Publisher(Channel):
         object_type = args[1] if len(args) > 1 else kwargs.get('object_type')
         hostname = args[2] if len(args) > 2 else kwargs.get('hostname', 'localhost')
         port = args[3] if len(args) > 3 else kwargs.get('port', 5672)
-        node_name = args[4] if len(args) > 4 else kwargs.get('node_name', 'pub_%s' % \
-        (str(object_type).split("\'")[1]))
         if not topic_name:
             raise AttributeError("Topic Name is not specified")
         if not object_type:
             raise AttributeError("Object Type is not specified")
+        self._type_name = object_type.DESCRIPTOR.full_name \
+        if hasattr(object_type, 'DESCRIPTOR') else object_type.__name__
+        node_name = args[4] if len(args) > 4 else kwargs.get('node_name', 'pub_%s' % \
+        (self._type_name))
         self._object_type = object_type
-        self._topic = topic_name
+        self._topic = sys.intern(topic_name)
+        self._batch_size = kwargs.get('batch_size', 64)
+        self._batch_count = 0
+        self._log_enabled = kwargs.get('log', False)
+        self._log_sample = kwargs.get('log_sample', 1)
+        self._log_counter = 0
+        self._log_prefix = _serialize_log(0, self._type_name, '')
+        self.publish = self._publish_str if object_type is str \
+        else self._publish_proto
         Channel.__init__(self, exchange_name=DEFAULT_EXCHANGE_NAME,\
          exchange_type="topic", hostname=hostname, port=port, node_name=node_name)
 
@@ -139,41 +285,74 @@ class Publisher(Channel):
         publisher for sending message to logging systems
         """
         Channel.create(self)
-        channel.exchange_declare(exchange=LOG_EXCHANGE_NAME,\
-         exchange_type="fanout")
-
-    def publish(self, message: 'Protobuf Message') -> 'Publishes message to RabbitMQ Broker':
-        """Method for publishing the message to the MQ Broker and also send
-        a message to log exchange for logging and monitoring"""
-        global channel
-        log_message = asvprotobuf.std_pb2.Log()
-        log_message.level = 0
-        message.header.sender = self.node_name
-        if not isinstance(message, self.type):
+        self._declare_exchange(LOG_EXCHANGE_NAME, "fanout")
+
+    def _publish_proto(self, message: 'Protobuf Message') -> 'Publishes message to RabbitMQ Broker':
+        """Publish path specialised for the declared protobuf type; bound
+        to `publish` in __init__ so the per-message type branching is
+        resolved once at construction. Also sends a message to the log
+        exchange for logging and monitoring, if enabled. Every batch_size
+        frames the connection is serviced once, so heartbeats are not
+        starved during long tight publish loops"""
+        ch = channel
+        log_enabled = self._log_enabled
+        if log_enabled and self._log_sample > 1:
+            self._log_counter += 1
+            log_enabled = self._log_counter % self._log_sample == 0
+        if type(message) is not self._object_type:  #pylint: disable=unidiomatic-typecheck
             raise ValueError("Please ensure that the message\
 passed to this method is of the same type as \
 defined during the Publisher declaration")
-        if isinstance(message, str):
-            log_message.name = "str"
-        else:
-            try:
-                log_message.name = str(type(message)).split("'")[1]
-                log_message.message = MessageToJson(message).replace("\n", "")\
-                .replace("\"", "'")
-                message = message.SerializeToString()
-            except:
-                raise ValueError("Are you sure that the message \
-                is Protocol Buffer message/string?")
-
-        log_success = channel.basic_publish(exchange=LOG_EXCHANGE_NAME,\
-         routing_key='', body=MessageToJson(log_message).replace("\n", "")\
-         .replace("\'", "'"))
-        if not log_success:
-            log_warn("Cannot deliver message to logger")
-        success = channel.basic_publish(exchange=self.exchange_name, \
-         routing_key=self.topic, body=message)
-        if not success:
-            raise pika.exceptions.ChannelError("Cannot deliver message to exchange")
+        message.header.sender = self._node_name
+        if log_enabled:
+            log_body = self._log_prefix+\
+            _encode_str_field(_LOG_MESSAGE_NUM, _json_bytes(message))
+        try:
+            message = message.SerializeToString()
+        except (EncodeError, AttributeError) as exc:
+            raise ValueError("Are you sure that the message \
+            is Protocol Buffer message/string?") from exc
+        if log_enabled:
+            ch.basic_publish(exchange=LOG_EXCHANGE_NAME,\
+             routing_key='', body=log_body)
+            self._batch_count += 1
+        ch.basic_publish(exchange=self._exchange_name, \
+         routing_key=self._topic, body=message)
+        self._batch_count += 1
+        if self._batch_count >= self._batch_size:
+            connection.process_data_events(time_limit=0)
+            self._batch_count = 0
+
+    def _publish_str(self, message: 'str') -> 'Publishes string message to RabbitMQ Broker':
+        """Publish path specialised for plain string topics; bound to
+        `publish` in __init__ when the declared object_type is str.
+        Batches connection servicing the same way as _publish_proto"""
+        ch = channel
+        log_enabled = self._log_enabled
+        if log_enabled and self._log_sample > 1:
+            self._log_counter += 1
+            log_enabled = self._log_counter % self._log_sample == 0
+        if type(message) is not str:  #pylint: disable=unidiomatic-typecheck
+            raise ValueError("Please ensure that the message\
+passed to this method is of the same type as \
+defined during the Publisher declaration")
+        if log_enabled:
+            ch.basic_publish(exchange=LOG_EXCHANGE_NAME,\
+             routing_key='', body=self._log_prefix)
+            self._batch_count += 1
+        ch.basic_publish(exchange=self._exchange_name, \
+         routing_key=self._topic, body=message)
+        self._batch_count += 1
+        if self._batch_count >= self._batch_size:
+            connection.process_data_events(time_limit=0)
+            self._batch_count = 0
+
+    def flush(self) -> 'Flushes buffered outgoing frames':
+        """Services the connection so buffered frames reach the socket.
+        Call this before shutting a publisher down"""
+        if connection is not None:
+            connection.process_data_events(time_limit=0)
+        self._batch_count = 0
 
 class Subscriber(Channel):  #pylint: disable=too-many-instance-attributes
     """Subscriber works on a callback function to process data
@@ -182,6 +361,12 @@ class Subscriber(Channel):  #pylint: disable=too-many-instance-attributes
     asvmq.Subscriber(<topic_name>, <object_type>, <callback_func>,
     [<callback_args>], [<ttl>], [<hostname>], [<port>])
     and the program will go in an infinite loop to get data from the given topic name
+
+    Note: for protobuf types the message handed to the callback is a single
+    preallocated buffer that is cleared and re-parsed in place on every
+    delivery, so it is only valid for the duration of the callback. If the
+    callback keeps messages around (queues, history, threads), it must take
+    a copy first, e.g. msg.__class__().CopyFrom(msg)
     """
     init_params = '<topic_name>, <object_type>, <callback_func>,\
      [<callback_args>], [<queue_size>], [<ttl>], [<hostname>], [<port>]'
@@ -195,24 +380,40 @@ class Subscriber(Channel):  #pylint: disable=too-many-instance-attributes
         ttl = args[5] if len(args) > 5 else kwargs.get('ttl', 10)
         hostname = args[6] if len(args) > 6 else kwargs.get('hostname', 'localhost')
         port = args[7] if len(args) > 7 else kwargs.get('port', 5672)
-        node_name = args[8] if len(args) > 8 else kwargs.get('node_name', 'sub_%s' % \
-        (str(object_type).split("\'")[1]))
         if not topic_name:
             raise AttributeError("Topic name is not specified")
         if not object_type:
             raise AttributeError("Object Type is not specified")
         if not callback:
             raise AttributeError("No callback function specified")
-        self._topic = topic_name
+        self._type_name = object_type.DESCRIPTOR.full_name \
+        if hasattr(object_type, 'DESCRIPTOR') else object_type.__name__
+        node_name = args[8] if len(args) > 8 else kwargs.get('node_name', 'sub_%s' % \
+        (self._type_name))
+        self._topic = sys.intern(topic_name)
         self._object_type = object_type
+        self._msg_buf = object_type() if object_type is not str else None
         self._queue = None
+        self._queue_name = None
         self._last_timestamp = 0
         self._callback = callback
         self._callback_args = callback_args
         self._ttl = ttl
         self._max_length = queue_size
+        self._graph_enabled = kwargs.get('graph', False)
+        self._prefetch = kwargs.get('prefetch', 50)
+        self._ack_batch = kwargs.get('ack_batch', 10)
+        self._ack_flush_interval = kwargs.get('ack_flush_interval', 0.2)
+        self._ack_buf = []
+        self.callback = self._callback_str if object_type is str \
+        else self._callback_proto
         Channel.__init__(self, exchange_name=DEFAULT_EXCHANGE_NAME,\
          exchange_type="topic", hostname=hostname, port=port, node_name=node_name)
+        self._basic_ack = channel.basic_ack
+        self._parse_buf = self._msg_buf.ParseFromString \
+        if self._msg_buf is not None else None
+        self._clear_buf = self._msg_buf.Clear \
+        if self._msg_buf is not None else None
 
     @property
     def type(self) -> 'Returns the type of object being receiveds':
@@ -232,15 +433,20 @@ class Subscriber(Channel):  #pylint: disable=too-many-instance-attributes
     @property
     def queue_name(self) -> 'Returns the name of the queue assigned by RabbitMQ broker':
         """Returns the Queue name if the queue exists"""
-        if self._queue is not None:
-            return self._queue.method.queue
-        return None
+        return self._queue_name
 
     @property
     def queue_size(self) -> 'Returns the max size of the queue':
         """Returns the Max Queue Size if the queue is presented"""
         return self._max_length
 
+    @property
+    def prefetch(self) -> 'Returns the consumer prefetch window':
+        """Returns the number of unacked messages the broker may have in
+        flight to this consumer. The default of 50 suits short callbacks;
+        drop it back towards 1 if each callback does long-running work"""
+        return self._prefetch
+
     def __str__(self) -> 'Returns log information':
         """Returns the debug information of the Subscriber"""
         return "Subscriber on topic %s on %s:%d, of type %s" %\
@@ -250,52 +456,106 @@ class Subscriber(Channel):  #pylint: disable=too-many-instance-attributes
         global channel
         """Creates a Temporary Queue for accessing Data from the exchange"""
         Channel.create(self)
-        channel.exchange_declare(exchange=GRAPH_EXCHANGE_NAME,\
-        exchange_type="fanout")
+        self._declare_exchange(GRAPH_EXCHANGE_NAME, "fanout")
         self._queue = channel.queue_declare(arguments=\
         {"x-message-ttl": self.ttl, "x-max-length": self.queue_size}, exclusive=True)
+        self._queue_name = sys.intern(self._queue.method.queue)
         channel.queue_bind(exchange=self.exchange_name, \
         queue=self.queue_name, routing_key=self.topic)
-        channel.basic_consume(self.callback, queue=self.queue_name)
-
-    def callback(self, _channel: 'pika.spec.Basic.Deliver', method: 'pika.Frame.Method', properties: 'pika.spec.BasicProperties', body: 'str or bytes') -> 'Consumer Tag(str)': # pylint: disable=line-too-long
-        """The Subscriber calls this function everytime
-         a message is received on the other end and publishes a message
-         to the graph exchange to form the barebones of graph"""
+        channel.basic_qos(prefetch_count=self.prefetch)
+        self._consumer_tag = channel.basic_consume(self.callback, \
+        queue=self.queue_name)
+        connection.add_timeout(self._ack_flush_interval, self._flush_acks)
+
+    def consume(self, inactivity_timeout: 'float' = 1.0) -> 'Consumes messages in a tight local loop': # pylint: disable=line-too-long
+        """Alternative to spin() for processes with a single subscriber:
+        drains the queue through channel.consume(), which yields frames
+        directly instead of dispatching through pika's callback machinery,
+        saving one Python frame per message. Cancels the basic_consume
+        registration first so deliveries are not split across both paths.
+        Blocks forever; the inactivity_timeout only bounds how long each
+        iteration waits before letting timers (like the ack flusher) run"""
+        channel.basic_cancel(self._consumer_tag)
+        callback = self.callback
+        for method, properties, body in \
+        channel.consume(self.queue_name, inactivity_timeout=inactivity_timeout):
+            if method is None:
+                continue
+            callback(None, method, properties, body)
+
+    def _flush_acks(self) -> 'Acks any buffered delivery tags':
+        """Acknowledges every buffered delivery tag with one multiple=True
+        frame and re-arms itself, so tags never sit unacked for more than
+        the flush interval when the topic goes quiet"""
+        if self._ack_buf:
+            self._basic_ack(delivery_tag=self._ack_buf[-1], multiple=True)
+            self._ack_buf.clear()
+        connection.add_timeout(self._ack_flush_interval, self._flush_acks)
+
+    def _callback_str(self, _channel: 'pika.spec.Basic.Deliver', method: 'pika.Frame.Method', properties: 'pika.spec.BasicProperties', body: 'str or bytes') -> 'Consumer Tag(str)': # pylint: disable=line-too-long
+        """Callback path specialised for plain string topics; bound to
+        `callback` in __init__ and hands the raw body to the user
+        callback. Acks through the shared batching buffer — without the
+        ack the broker would stop delivering once the prefetch window
+        filled with unacknowledged messages"""
         del _channel, properties
-        if self.type is None or self.type == str:
-            self._callback(body)
-        else:
-            if isinstance(body, str):
-                data = bytearray(body, "utf-8")
-                body = bytes(data)
-            _type = self.type
-            if _type != str:
-                try:
-                    msg = _type.FromString(body)
-                except:
-                    raise ValueError("Is the Message sent Protocol\
-                    Buffers message or string?")
-            channel.basic_ack(delivery_tag=method.delivery_tag)
-            graph_message = asvprotobuf.std_pb2.Graph()
-            graph_message.sender = msg.header.sender
-            graph_message.msg_type = str(self.type).split("\'")[1]
-            graph_message.receiver = self._node_name
+        ack_buf = self._ack_buf
+        ack_buf.append(method.delivery_tag)
+        if len(ack_buf) >= self._ack_batch:
+            self._basic_ack(delivery_tag=ack_buf[-1], multiple=True)
+            ack_buf.clear()
+        self._callback(body)
+
+    def _callback_proto(self, _channel: 'pika.spec.Basic.Deliver', method: 'pika.Frame.Method', properties: 'pika.spec.BasicProperties', body: 'str or bytes') -> 'Consumer Tag(str)': # pylint: disable=line-too-long
+        """Callback path specialised for the declared protobuf type;
+        bound to `callback` in __init__. The Subscriber calls this
+        function everytime a message is received on the other end and
+        publishes a message to the graph exchange to form the barebones
+        of graph, if enabled.
+        The message passed to the user callback is the reused _msg_buf
+        instance and is invalidated by the next delivery; callbacks that
+        retain messages must copy them (see the class docstring)"""
+        del _channel, properties
+        ch = channel
+        if isinstance(body, str):
+            body = body.encode("latin-1")
+        self._clear_buf()
+        try:
+            self._parse_buf(body)
+        except (DecodeError, AttributeError) as exc:
+            raise ValueError("Is the Message sent Protocol\
+            Buffers message or string?") from exc
+        msg = self._msg_buf
+        ack_buf = self._ack_buf
+        ack_buf.append(method.delivery_tag)
+        if len(ack_buf) >= self._ack_batch:
+            self._basic_ack(delivery_tag=ack_buf[-1], multiple=True)
+            ack_buf.clear()
+        if self._graph_enabled:
             curr_timestamp = msg.header.stamp
-            if self._last_timestamp == 0:
-                graph_message.freq = 0
-            else:
-                if curr_timestamp-self._last_timestamp != 0:
-                    graph_message.freq = 1/(curr_timestamp-self._last_timestamp)
+            delta = curr_timestamp-self._last_timestamp
+            freq = 1/delta if self._last_timestamp != 0 and delta > 0 else 0
             self._last_timestamp = curr_timestamp
-            if graph_message.freq < 0:
-                graph_message.freq = 0
-            graph_success = channel.basic_publish(exchange=GRAPH_EXCHANGE_NAME,\
-             routing_key='', body=MessageToJson(graph_message).replace("\n", "")\
-             .replace("\'", "'"))
-            if not graph_success:
-                log_warn("The messages cannot be sent to graph.")
-            self._callback(msg, self._callback_args)
+            ch.basic_publish(exchange=GRAPH_EXCHANGE_NAME,\
+             routing_key='', body=_serialize_graph(msg.header.sender,\
+             self._type_name, self._node_name, freq))
+        self._callback(msg, self._callback_args)
+
+def close() -> 'Closes the shared channel and pooled connections':
+    """Closes the shared channel and every pooled connection so sockets
+    are handed back to the OS immediately rather than at interpreter
+    shutdown. Publishers should flush() first; any Channel constructed
+    afterwards reopens the connection on demand"""
+    global channel, connection
+    if channel is not None and channel.is_open:
+        try:
+            channel.close()
+        except Exception:  #pylint: disable=broad-except
+            pass
+    channel = None
+    connection = None
+    _log_channels.clear()
+    _close_connections()
 
 def spin(start: 'bool' = True) -> 'Enables the loop to start message comsumption on callbacks':
     """This function will start the loop of Pika to start consuming"""
@@ -314,12 +574,10 @@ def _log(string: 'Log message', **kwargs: "['level']") -> 'Logs message':
     global channel
     kwargs["exchange_name"] = LOG_EXCHANGE_NAME
     kwargs["exchange_type"] = "fanout"
-    _channel = Channel(**kwargs)
-    log_message = asvprotobuf.std_pb2.Log()
-    log_message.level = level
-    log_message.name = "str"
-    log_message.message = string
-    log_message = MessageToJson(log_message).replace("\n", "").replace("\'", "'")
+    key = (kwargs.get('hostname', 'localhost'), kwargs.get('port', 5672))
+    if key not in _log_channels:
+        _log_channels[key] = Channel(**kwargs)
+    log_message = _serialize_log(level, "str", string)
     channel.basic_publish(exchange=LOG_EXCHANGE_NAME, \
     body=log_message, routing_key='')
     if level == 0:
@@ -359,7 +617,7 @@ def log_fatal(string: 'Log message') -> 'Logs message as fatal error':
 
 def init() -> 'Initialises ASVMQ exception handling mechanism and init channel':
     """Initialises the exception handling of asvmq"""
-    global channel
+    global channel, connection
     def excepthook(exctype, excvalue, exctb):
         err_traceback = traceback.format_exception(exctype, excvalue, exctb)
         _log("".join(err_traceback).strip(), level=3)
@@ -370,6 +628,7 @@ def init() -> 'Initialises ASVMQ exception handling mechanism and init channel':
     else:
         hostname[1] = int(hostname[1])
     if channel is None:
-        channel = pika.BlockingConnection(pika.ConnectionParameters(*hostname)).channel()
+        connection = _get_connection(pika.ConnectionParameters(*hostname))
+        channel = connection.channel()
 
 init()
@@ -3,6 +3,7 @@
 
 import sys
 import os
+import re
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -17,8 +18,8 @@ except ImportError:
 readme = open(os.path.join(BASE_DIR,"README.md")).read()
 requirements = open(os.path.join(BASE_DIR,"requirements.txt")).read().strip().split('\n')
 
-import asvmq
-version = asvmq.__version__
+with open(os.path.join(BASE_DIR,"asvmq","__init__.py")) as init_file:
+    version = re.search(r'__version__\s*=\s*"(.+?)"', init_file.read()).group(1)
 
 setup(
     name="asvmq",